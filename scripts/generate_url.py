@@ -9,8 +9,10 @@ Generates separate markdown files for each file type.
 import os
 import sys
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple, Callable, Optional
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple, Callable, Optional
 
 # Try to import TOML library
 try:
@@ -29,6 +31,9 @@ except ImportError:
 # Default base URL when not in config.toml
 DEFAULT_BASE_URL = "https://assets2.openterface.com"
 
+# Translation table turning path separators into hyphens for link names
+_SLASH_TRANS = str.maketrans({'/': '-', '\\': '-'})
+
 # File type configuration mapping
 FILE_TYPE_MAPPING = {
     'webp': {
@@ -37,7 +42,7 @@ FILE_TYPE_MAPPING = {
         'src_dir': 'src/images',
         'dist_dir': 'dist/images',
         'url_path': 'images',
-        'transform': lambda p: p.with_suffix('.webp'),
+        'transform': lambda s: os.path.splitext(s)[0] + '.webp',
         'output_file': 'webp.md',
         'description': 'WebP Image Links'
     },
@@ -46,7 +51,7 @@ FILE_TYPE_MAPPING = {
         'src_dir': 'src/images',
         'dist_dir': 'dist/images',
         'url_path': 'images',
-        'transform': lambda p: p,  # No transformation
+        'transform': lambda s: s,  # No transformation
         'output_file': 'svg.md',
         'description': 'SVG Image Links'
     },
@@ -55,7 +60,7 @@ FILE_TYPE_MAPPING = {
         'src_dir': 'src/images',
         'dist_dir': 'dist/images',
         'url_path': 'images',
-        'transform': lambda p: p,  # No transformation
+        'transform': lambda s: s,  # No transformation
         'output_file': 'gif.md',
         'description': 'GIF Image Links'
     },
@@ -65,7 +70,7 @@ FILE_TYPE_MAPPING = {
         'src_dir': 'src/css',
         'dist_dir': 'dist/css',
         'url_path': 'css',
-        'transform': lambda p: p.with_name(p.stem + '.min.css'),
+        'transform': lambda s: os.path.splitext(s)[0] + '.min.css',
         'output_file': 'css.md',
         'description': 'CSS File Links'
     },
@@ -75,7 +80,7 @@ FILE_TYPE_MAPPING = {
         'src_dir': 'src/js',
         'dist_dir': 'dist/js',
         'url_path': 'js',
-        'transform': lambda p: p.with_name(p.stem + '.min.js'),
+        'transform': lambda s: os.path.splitext(s)[0] + '.min.js',
         'output_file': 'js.md',
         'description': 'JavaScript File Links'
     },
@@ -84,7 +89,7 @@ FILE_TYPE_MAPPING = {
         'src_dir': 'src/data',
         'dist_dir': 'dist/data',
         'url_path': 'data',
-        'transform': lambda p: p,  # No transformation
+        'transform': lambda s: s,  # No transformation
         'output_file': 'data.md',
         'description': 'Data File Links'
     },
@@ -93,12 +98,31 @@ FILE_TYPE_MAPPING = {
         'src_dir': 'src/md',
         'dist_dir': 'dist/md',
         'url_path': 'md',
-        'transform': lambda p: p,  # No transformation
+        'transform': lambda s: s,  # No transformation
         'output_file': 'md.md',
         'description': 'Markdown File Links'
     }
 }
 
+# Store extension lists as lowercase frozensets so suffix checks are O(1)
+for _config in FILE_TYPE_MAPPING.values():
+    for _key in ('extensions', 'dist_extensions'):
+        if _key in _config:
+            _config[_key] = frozenset(ext.lower() for ext in _config[_key])
+del _config, _key
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict:
+    """
+    Parse config.toml once per (path, mtime) pair.
+    
+    The modification time is part of the cache key so edits to the file
+    are picked up on the next call.
+    """
+    with open(config_path, 'rb') as f:
+        return tomllib.load(f)
+
 
 def load_config(project_root: Path) -> Dict:
     """
@@ -112,16 +136,16 @@ def load_config(project_root: Path) -> Dict:
     """
     config_path = project_root / "config.toml"
     
-    if not config_path.exists():
+    if tomllib is None:
         return {}
     
-    if tomllib is None:
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
         return {}
     
     try:
-        with open(config_path, 'rb') as f:
-            config = tomllib.load(f)
-        return config
+        return _load_config_cached(str(config_path.resolve()), mtime_ns)
     except Exception as e:
         print(f"Warning: Could not read config.toml: {e}")
         return {}
@@ -146,88 +170,104 @@ def get_base_url_from_config(project_root: Path) -> str:
     return DEFAULT_BASE_URL
 
 
-def find_files_by_type(directory: Path, extensions: List[str], base_dir: Path) -> List[Path]:
-    """Find all files with given extensions in directory."""
-    files = []
-    if not directory.exists():
-        return files
-    
-    for root, dirs, filenames in os.walk(directory):
-        for filename in filenames:
-            file_path = Path(root) / filename
-            if file_path.suffix.lower() in extensions:
-                # Get relative path from base directory
-                try:
-                    rel_path = file_path.relative_to(base_dir)
-                    files.append(rel_path)
-                except ValueError:
-                    # Skip if file is not under base_dir
-                    continue
-    
-    return sorted(files)
+def _iter_files(directory: str, extensions: FrozenSet[str], prefix_len: int) -> Iterator[str]:
+    """
+    Recursively yield paths of matching files under directory, relative to the
+    base directory whose prefix length (including the trailing separator) is
+    prefix_len.
+    """
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        # Skip unreadable directories, as os.walk does by default
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path, extensions, prefix_len)
+            elif os.path.splitext(entry.name)[1].lower() in extensions:
+                yield entry.path[prefix_len:]
+
+
+def find_files_by_type(directory: Path, extensions: FrozenSet[str], base_dir: Path) -> Iterator[str]:
+    """
+    Yield all files with given extensions in directory, as POSIX-style path
+    strings relative to base_dir.
+    extensions is a set of lowercase suffixes (e.g. frozenset({'.png'})).
+    Files are yielded in directory order; callers needing a stable order sort.
+    """
+    if not directory.is_dir():
+        return
+    
+    # Only files under base_dir can be expressed relative to it
+    base_prefix = os.path.join(str(base_dir), '')
+    directory_str = str(directory)
+    if not os.path.join(directory_str, '').startswith(base_prefix):
+        return
+    
+    files = _iter_files(directory_str, extensions, len(base_prefix))
+    if os.sep != '/':
+        files = (rel.replace(os.sep, '/') for rel in files)
+    yield from files
 
 
-def scan_source_directory(project_root: Path, file_type_config: Dict) -> List[Tuple[Path, Path]]:
+def _link_name(final_path: str) -> str:
+    """
+    Create a descriptive link text for a final path: the path without its
+    extension, with path separators replaced by hyphens.
+    """
+    return os.path.splitext(final_path)[0].translate(_SLASH_TRANS)
+
+
+def scan_source_directory(project_root: Path, file_type_config: Dict) -> Iterator[Tuple[str, str, str]]:
     """
     Scan src/ directory and predict final URLs based on build transformations.
-    Returns list of (source_path, transformed_path) tuples.
+    Yields (source_path, transformed_path, link_name) tuples.
     """
     src_dir = project_root / file_type_config['src_dir']
     files = find_files_by_type(src_dir, file_type_config['extensions'], src_dir)
-    
-    result = []
     transform_func = file_type_config['transform']
     
     for file_path in files:
         # Apply transformation to predict final path
-        transformed_path = transform_func(file_path)
-        result.append((file_path, transformed_path))
-    
-    return result
+        final_path = transform_func(file_path)
+        yield file_path, final_path, _link_name(final_path)
 
 
-def scan_dist_directory(project_root: Path, file_type_config: Dict) -> List[Tuple[Path, Path]]:
+def scan_dist_directory(project_root: Path, file_type_config: Dict) -> Iterator[Tuple[str, str, str]]:
     """
     Scan dist/ directory to list actual built files.
-    Returns list of (actual_path, actual_path) tuples (no transformation needed).
+    Yields (actual_path, actual_path, link_name) tuples (no transformation needed).
     """
     dist_dir = project_root / file_type_config['dist_dir']
     # Use dist_extensions if available, otherwise use regular extensions
     extensions = file_type_config.get('dist_extensions', file_type_config['extensions'])
     files = find_files_by_type(dist_dir, extensions, dist_dir)
     
-    result = []
     for file_path in files:
         # In dist mode, use actual file path (no transformation)
-        result.append((file_path, file_path))
-    
-    return result
+        yield file_path, file_path, _link_name(file_path)
 
 
-def generate_markdown_links(
-    file_pairs: List[Tuple[Path, Path]],
-    url_path: str,
-    base_url: str = DEFAULT_BASE_URL
-) -> List[str]:
-    """Generate markdown links for files."""
-    markdown_lines = []
-    
-    for source_path, final_path in file_pairs:
-        # Create the full URL
-        full_url = f"{base_url}/{url_path}/{final_path.as_posix()}"
-        
-        # Create a descriptive name for the link text
-        # Remove path separators and file extension, replace with hyphens
-        link_name = str(final_path).replace('/', '-').replace('\\', '-')
-        # Remove extension
-        if final_path.suffix:
-            link_name = link_name.replace(final_path.suffix, '')
-        
-        # Generate markdown link
-        markdown_link = f"[{link_name}]({full_url})"
-        markdown_lines.append(markdown_link)
-    
-    return markdown_lines
+# Source for a link generator specialized to one URL prefix. The prefix is
+# baked in as a string literal so the per-entry work is plain concatenation.
+_LINK_GENERATOR_TEMPLATE = """
+def generate_links(file_entries):
+    return ['[' + link_name + {separator!r} + final_path + ')' for _, final_path, link_name in file_entries]
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def get_link_generator(url_path: str, base_url: str) -> Callable[[Iterable[Tuple[str, str, str]]], List[str]]:
+    """
+    Compile a function mapping (source_path, final_path, link_name) entries to
+    "[link_name](base_url/url_path/final_path)" markdown links, with the URL
+    prefix for url_path inlined. Generators are cached per (url_path, base_url).
+    """
+    source = _LINK_GENERATOR_TEMPLATE.format(separator=f"]({base_url}/{url_path}/")
+    namespace = {}
+    exec(compile(source, f"<link generator: {url_path}>", 'exec'), namespace)
+    return namespace['generate_links']
 
 
 def write_markdown_file(
@@ -238,22 +278,28 @@ def write_markdown_file(
     source_dir: str
 ):
     """Write markdown file with links."""
+    if scan_mode == 'src':
+        origin = (
+            f"Generated from source files in `{source_dir}/`\n"
+            "These URLs are predicted based on build transformations.\n\n"
+        )
+    else:
+        origin = (
+            f"Generated from built files in `{source_dir}/`\n"
+            "These are the actual URLs available after build.\n\n"
+        )
+    
+    if markdown_lines:
+        body = (
+            "Copy and paste these links into your markdown files:\n\n"
+            + "\n\n".join(markdown_lines) + "\n\n"
+        )
+    else:
+        body = "No files found for this type.\n\n"
+    
+    # Emit the whole document with a single write
     with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(f"# {description}\n\n")
-        
-        if scan_mode == 'src':
-            f.write(f"Generated from source files in `{source_dir}/`\n")
-            f.write("These URLs are predicted based on build transformations.\n\n")
-        else:
-            f.write(f"Generated from built files in `{source_dir}/`\n")
-            f.write("These are the actual URLs available after build.\n\n")
-        
-        if markdown_lines:
-            f.write("Copy and paste these links into your markdown files:\n\n")
-            for line in markdown_lines:
-                f.write(line + "\n\n")
-        else:
-            f.write("No files found for this type.\n\n")
+        f.write(f"# {description}\n\n{origin}{body}")
 
 
 def process_file_type(
@@ -263,29 +309,31 @@ def process_file_type(
     scan_dist: bool,
     base_url: str,
     output_dir: Path
-) -> Tuple[int, bool]:
+) -> Tuple[int, bool, Optional[str]]:
     """
     Process a single file type and generate its markdown file.
-    Returns (file_count, success) tuple.
+    Returns (file_count, success, first_link) tuple; first_link is None
+    when no files were found.
     """
     if scan_dist:
-        file_pairs = scan_dist_directory(project_root, file_type_config)
+        entries = scan_dist_directory(project_root, file_type_config)
         source_dir = file_type_config['dist_dir']
         scan_mode = 'dist'
     else:
-        file_pairs = scan_source_directory(project_root, file_type_config)
+        entries = scan_source_directory(project_root, file_type_config)
         source_dir = file_type_config['src_dir']
         scan_mode = 'src'
     
-    if not file_pairs:
-        return 0, False
+    # Materialize and sort once, component-wise by source path (the same
+    # order Path objects sort in), for deterministic output
+    file_entries = sorted(entries, key=lambda entry: entry[0].split('/'))
+    
+    if not file_entries:
+        return 0, False, None
     
     # Generate markdown links
-    markdown_lines = generate_markdown_links(
-        file_pairs,
-        file_type_config['url_path'],
-        base_url
-    )
+    generate_links = get_link_generator(file_type_config['url_path'], base_url)
+    markdown_lines = generate_links(file_entries)
     
     # Write to output file
     output_file = output_dir / file_type_config['output_file']
@@ -297,7 +345,7 @@ def process_file_type(
         source_dir
     )
     
-    return len(file_pairs), True
+    return len(file_entries), True, markdown_lines[0]
 
 
 def main():
@@ -370,26 +418,41 @@ Examples:
     print("=" * 60)
     print()
     
-    # Process each file type
+    # Process file types concurrently; each is an independent directory walk
+    # plus a write to its own output file
+    outcomes = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(FILE_TYPE_MAPPING))) as executor:
+        futures = {
+            executor.submit(
+                process_file_type,
+                project_root,
+                file_type,
+                config,
+                args.dist,
+                base_url,
+                output_dir
+            ): file_type
+            for file_type, config in FILE_TYPE_MAPPING.items()
+        }
+        for future in as_completed(futures):
+            outcomes[futures[future]] = future.result()
+    
+    # Report in FILE_TYPE_MAPPING order from the main thread
     results = {}
     total_files = 0
+    example_link = None
     
-    for file_type, config in FILE_TYPE_MAPPING.items():
-        print(f"Processing {file_type} files...", end=' ', flush=True)
+    for file_type in FILE_TYPE_MAPPING:
+        print(f"Processing {file_type} files...", end=' ')
         
-        file_count, success = process_file_type(
-            project_root,
-            file_type,
-            config,
-            args.dist,
-            base_url,
-            output_dir
-        )
+        file_count, success, first_link = outcomes[file_type]
         
         if success:
             print(f"✓ Found {file_count} files")
             results[file_type] = file_count
             total_files += file_count
+            if example_link is None:
+                example_link = first_link
         else:
             print("✗ No files found")
             results[file_type] = 0
@@ -410,19 +473,9 @@ Examples:
     print("=" * 60)
     
     # Show examples
-    if total_files > 0:
+    if example_link is not None:
         print("\nExample links from first file type with files:")
-        for file_type, count in results.items():
-            if count > 0:
-                output_file = output_dir / FILE_TYPE_MAPPING[file_type]['output_file']
-                with open(output_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    # Find first markdown link
-                    for line in lines:
-                        if line.strip().startswith('['):
-                            print(f"  {line.strip()}")
-                            break
-                break
+        print(f"  {example_link}")
 
 
 if __name__ == "__main__":
@@ -5,26 +5,90 @@ Allows you to select an image from the project, view its properties,
 and resize it proportionally.
 """
 
+import bisect
 import os
 from pathlib import Path
 from PIL import Image
 import sys
 
 
-# Supported image formats
-SUPPORTED_FORMATS = {'.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp', '.tiff', '.tif'}
+# Supported image formats (lowercase; file suffixes are lowercased before
+# lookup, so e.g. IMG.PNG matches without a separate uppercase pass)
+SUPPORTED_FORMATS = frozenset({'.png', '.jpg', '.jpeg', '.webp', '.gif', '.bmp', '.tiff', '.tif'})
+
+# Image metadata keyed by (path, mtime_ns, size), so re-selecting an
+# unchanged image doesn't decode its header again
+_INFO_CACHE = {}
+
+
+def _iter_images(root):
+    """
+    Yield (path, rel_path, size) for supported image files under root, walking
+    the tree once. rel_path is sliced off the root prefix and sizes come from
+    the DirEntry's own stat() result.
+    """
+    root = os.fspath(root)
+    prefix_len = len(os.path.join(root, ''))
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            # Skip unreadable directories, as Path.rglob does
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif os.path.splitext(entry.name)[1].lower() in SUPPORTED_FORMATS:
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        # e.g. a dangling symlink; still list it, as rglob did
+                        size = 0
+                    yield entry.path, entry.path[prefix_len:], size
 
 
 def find_images(directory):
-    """Recursively find all image files in the directory."""
-    images = []
-    directory_path = Path(directory)
-    
-    for ext in SUPPORTED_FORMATS:
-        images.extend(directory_path.rglob(f'*{ext}'))
-        images.extend(directory_path.rglob(f'*{ext.upper()}'))
+    """
+    Recursively find all image files in the directory.
+    Returns a sorted list of (path, rel_path, file_size) tuples, where
+    rel_path is the path relative to directory as a string.
+    """
+    return sorted((Path(p), rel, size) for p, rel, size in _iter_images(directory))
+
+
+def get_file_size(path):
+    """Return the size of path in bytes, or 0 if it cannot be read."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def update_image_list(images, saved_paths, root):
+    """
+    Update a find_images() listing in place for files written under root:
+    re-stat entries that were overwritten and insert new supported images
+    in sorted position. Other entries are left untouched.
+    """
+    prefix = os.path.join(os.fspath(root), '')
     
-    return sorted(images)
+    for saved_path in saved_paths:
+        path_str = os.path.normpath(saved_path)
+        if not path_str.startswith(prefix):
+            continue
+        if os.path.splitext(path_str)[1].lower() not in SUPPORTED_FORMATS:
+            continue
+        
+        path = Path(path_str)
+        entry = (path, path_str[len(prefix):], get_file_size(path_str))
+        # (path,) sorts just before any entry for the same path
+        i = bisect.bisect_left(images, (path,))
+        if i < len(images) and images[i][0] == path:
+            images[i] = entry
+        else:
+            images.insert(i, entry)
 
 
 def format_file_size(size_bytes):
@@ -39,26 +103,36 @@ def format_file_size(size_bytes):
 def display_image_info(image_path):
     """Display image information."""
     try:
-        with Image.open(image_path) as img:
-            width, height = img.size
-            file_size = os.path.getsize(image_path)
-            
-            print("\n" + "="*60)
-            print(f"Image: {image_path}")
-            print(f"Dimensions: {width} x {height} pixels")
-            print(f"File Size: {format_file_size(file_size)}")
-            print(f"Format: {img.format}")
-            print(f"Mode: {img.mode}")
-            print("="*60 + "\n")
-            
-            return width, height, file_size
+        stat = os.stat(image_path)
+        cache_key = (os.fspath(image_path), stat.st_mtime_ns, stat.st_size)
+        info = _INFO_CACHE.get(cache_key)
+        
+        if info is None:
+            with Image.open(image_path) as img:
+                info = (img.size[0], img.size[1], img.format, img.mode, stat.st_size)
+            _INFO_CACHE[cache_key] = info
+        
+        width, height, image_format, mode, file_size = info
+        
+        print("\n" + "="*60)
+        print(f"Image: {image_path}")
+        print(f"Dimensions: {width} x {height} pixels")
+        print(f"File Size: {format_file_size(file_size)}")
+        print(f"Format: {image_format}")
+        print(f"Mode: {mode}")
+        print("="*60 + "\n")
+        
+        return width, height, file_size
     except Exception as e:
         print(f"Error reading image: {e}")
         return None, None, None
 
 
 def resize_image_proportionally(image_path, target_width=None, target_height=None, scale_factor=None):
-    """Resize image proportionally based on target width, height, or scale factor."""
+    """
+    Resize image proportionally based on target width, height, or scale factor.
+    Returns the path the resized image was saved to, or False on failure.
+    """
     try:
         with Image.open(image_path) as img:
             original_width, original_height = img.size
@@ -108,7 +182,7 @@ def resize_image_proportionally(image_path, target_width=None, target_height=Non
             print(f"  New dimensions: {new_width} x {new_height} pixels")
             print(f"  New file size: {format_file_size(new_size)}")
             
-            return True
+            return output_path
             
     except Exception as e:
         print(f"Error resizing image: {e}")
@@ -116,11 +190,15 @@ def resize_image_proportionally(image_path, target_width=None, target_height=Non
 
 
 def handle_image_resize_menu(image_path):
-    """Handle the resize menu for a specific image."""
+    """
+    Handle the resize menu for a specific image.
+    Returns the list of paths written by resizes made from the menu.
+    """
     width, height, file_size = display_image_info(image_path)
+    saved_paths = []
     
     if width is None:
-        return False
+        return saved_paths
     
     # Resize options
     while True:
@@ -138,7 +216,7 @@ def handle_image_resize_menu(image_path):
                 if scale <= 0:
                     print("Scale factor must be positive.")
                     continue
-                resize_image_proportionally(image_path, scale_factor=scale)
+                saved_paths.append(resize_image_proportionally(image_path, scale_factor=scale))
             except ValueError:
                 print("Invalid scale factor. Please enter a number.")
         
@@ -148,7 +226,7 @@ def handle_image_resize_menu(image_path):
                 if target_w <= 0:
                     print("Width must be positive.")
                     continue
-                resize_image_proportionally(image_path, target_width=target_w)
+                saved_paths.append(resize_image_proportionally(image_path, target_width=target_w))
             except ValueError:
                 print("Invalid width. Please enter a number.")
         
@@ -158,12 +236,12 @@ def handle_image_resize_menu(image_path):
                 if target_h <= 0:
                     print("Height must be positive.")
                     continue
-                resize_image_proportionally(image_path, target_height=target_h)
+                saved_paths.append(resize_image_proportionally(image_path, target_height=target_h))
             except ValueError:
                 print("Invalid height. Please enter a number.")
         
         elif resize_choice == '4':
-            return True
+            return [path for path in saved_paths if path]
         
         else:
             print("Invalid option. Please try again.")
@@ -238,9 +316,8 @@ def main():
         print("\n" + "-"*60)
         print("Available Images:")
         print("-"*60)
-        for idx, img_path in enumerate(images, 1):
-            rel_path = img_path.relative_to(project_root)
-            print(f"{idx:3d}. {rel_path}")
+        for idx, (_, rel_path, file_size) in enumerate(images, 1):
+            print(f"{idx:3d}. {rel_path} ({format_file_size(file_size)})")
         
         print(f"\n{len(images) + 1:3d}. Exit")
         print("-"*60)
@@ -262,10 +339,11 @@ def main():
                 print("Invalid selection. Please try again.")
                 continue
             
-            selected_image = images[choice_num - 1]
+            selected_image = images[choice_num - 1][0]
             
-            # Handle resize menu
-            handle_image_resize_menu(selected_image)
+            # Handle resize menu, then update the listing for the files it wrote
+            saved_paths = handle_image_resize_menu(selected_image)
+            update_image_list(images, saved_paths, project_root)
         
         except ValueError:
             print("Invalid input. Please enter a number.")
@@ -7,8 +7,11 @@ This script helps you configure the template for your GitHub repository.
 import os
 import sys
 import re
+import functools
+import shlex
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple, List
 
@@ -25,11 +28,85 @@ class Colors:
     UNDERLINE = '\033[4m'
 
 
+# Skip ANSI codes entirely when output isn't a terminal or NO_COLOR is set
+if sys.stdout is None or not sys.stdout.isatty() or os.environ.get('NO_COLOR'):
+    for _name in ('HEADER', 'OKBLUE', 'OKCYAN', 'OKGREEN', 'WARNING', 'FAIL', 'ENDC', 'BOLD', 'UNDERLINE'):
+        setattr(Colors, _name, '')
+    del _name
+
+
+# Template project root (the directory containing this script) and its parent,
+# resolved once at import
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_SCRIPT_PARENT = _SCRIPT_DIR.parent
+
+# GitHub usernames: alphanumeric and hyphens, 1-39 characters
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,37}[a-zA-Z0-9])?$')
+# Repository names: alphanumeric, hyphens, underscores, dots, 1-100 characters
+_REPO_RE = re.compile(r'^[a-zA-Z0-9._-]{1,100}$')
+# Accepted GitHub URL prefixes, each followed by username/repo-name
+_GITHUB_URL_PREFIXES = ('https://github.com/', 'http://github.com/', 'git@github.com:', 'github.com/')
+# Common SSH key file names (private and public) looked for by check_ssh_keys
+_SSH_KEY_FILES = frozenset(
+    name
+    for key_file in ('id_rsa', 'id_ed25519', 'id_ecdsa', 'id_dsa')
+    for name in (key_file, f"{key_file}.pub")
+)
+# Size of the block buffer stdout is switched to while setup runs
+_STDOUT_BUFFER_SIZE = 128 * 1024
+# Worker threads used to copy template files in parallel
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+# base_url / domain assignments rewritten by update_config_toml
+_CONFIG_SETTING_RE = re.compile(rb'(base_url|domain)\s*=\s*"[^"]*"')
+
+# Pre-colored prefixes matching print_info() and the fatal-error message
+_INFO_PREFIX = f"{Colors.OKCYAN}ℹ "
+_ERR_PREFIX = f"{Colors.FAIL}✗ An unexpected error occurred: "
+# Written straight to the stdout file descriptor when setup is interrupted
+_CANCELLED_MSG = f"\n\n{Colors.WARNING}Setup cancelled by user.{Colors.ENDC}\n".encode('utf-8')
+
+# Closing troubleshooting section of main(). Colors are resolved here, once;
+# the colorized {ghpages_tree} and {ghpages_images} URLs are filled in with
+# str.format at the end of setup.
+_TROUBLESHOOT_TMPL = (
+    f"{Colors.BOLD}Troubleshooting:{Colors.ENDC}\n"
+    "   If you get 404 errors, check:\n"
+    "   - Verify workflow completed successfully\n"
+    "   - Check that 'gh-pages' branch exists: {ghpages_tree}\n"
+    "   - Verify GitHub Pages is set to 'gh-pages' branch (not 'main')\n"
+    "   - Wait a few minutes - GitHub Pages can take 2-5 minutes to update\n"
+    "   - Check if files exist in gh-pages branch: {ghpages_images}\n\n"
+    f"{_INFO_PREFIX}Follow the steps above to complete your GitHub Pages setup.{Colors.ENDC}\n"
+    f"{_INFO_PREFIX}For detailed instructions, see: {Colors.OKCYAN}SETUP.md{Colors.ENDC}\n{Colors.ENDC}\n"
+)
+
+
+def use_buffered_stdout():
+    """Replace sys.stdout with a large block-buffered writer on the same file descriptor.
+    Output is flushed before every input() prompt, before each long-running
+    copy, git step or wait on a background task, and when setup exits, so
+    it still appears in order, but in fewer, larger writes.
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a real file (e.g. replaced by an in-memory stream)
+        return
+    sys.stdout.flush()
+    sys.stdout = open(
+        fd,
+        'w',
+        buffering=_STDOUT_BUFFER_SIZE,
+        encoding=sys.stdout.encoding,
+        errors=sys.stdout.errors,
+        closefd=False
+    )
+
+
 def print_header(text: str):
     """Print a formatted header."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text.center(60)}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}\n")
+    bar = f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}"
+    sys.stdout.write(f"\n{bar}\n{Colors.HEADER}{Colors.BOLD}{text.center(60)}{Colors.ENDC}\n{bar}\n\n")
 
 
 def print_success(text: str):
@@ -56,18 +133,14 @@ def validate_github_username(username: str) -> bool:
     """Validate GitHub username format."""
     if not username:
         return False
-    # GitHub usernames: alphanumeric and hyphens, 1-39 characters
-    pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,37}[a-zA-Z0-9])?$'
-    return bool(re.match(pattern, username))
+    return bool(_USERNAME_RE.match(username))
 
 
 def validate_repo_name(repo_name: str) -> bool:
     """Validate repository name format."""
     if not repo_name:
         return False
-    # Repository names: alphanumeric, hyphens, underscores, dots, 1-100 characters
-    pattern = r'^[a-zA-Z0-9._-]{1,100}$'
-    return bool(re.match(pattern, repo_name))
+    return bool(_REPO_RE.match(repo_name))
 
 
 def parse_github_url(url: str) -> Tuple[Optional[str], Optional[str]]:
@@ -89,22 +162,21 @@ def parse_github_url(url: str) -> Tuple[Optional[str], Optional[str]]:
     # Remove trailing slash
     url = url.rstrip('/')
     
-    # Pattern for GitHub URLs
-    patterns = [
-        r'https?://github\.com/([^/]+)/([^/]+)',  # HTTPS
-        r'git@github\.com:([^/]+)/([^/]+)',       # SSH
-        r'github\.com/([^/]+)/([^/]+)',            # Without protocol
-    ]
-    
-    for pattern in patterns:
-        match = re.match(pattern, url)
-        if match:
-            username = match.group(1)
-            repo_name = match.group(2)
-            
-            # Validate extracted values
-            if validate_github_username(username) and validate_repo_name(repo_name):
-                return username, repo_name
+    for prefix in _GITHUB_URL_PREFIXES:
+        if url.startswith(prefix):
+            path = url[len(prefix):]
+            break
+    else:
+        return None, None
+    
+    segments = path.split('/', 2)
+    if len(segments) < 2:
+        return None, None
+    username, repo_name = segments[0], segments[1]
+    
+    # Validate extracted values
+    if validate_github_username(username) and validate_repo_name(repo_name):
+        return username, repo_name
     
     return None, None
 
@@ -113,10 +185,12 @@ def get_github_repo_url() -> Tuple[str, str]:
     """Prompt for GitHub repository URL and extract username and repo name."""
     print_info("Enter your GitHub repository URL.")
     print_info("Examples:")
-    print(f"  {Colors.OKCYAN}https://github.com/username/repo-name{Colors.ENDC}")
-    print(f"  {Colors.OKCYAN}https://github.com/username/repo-name.git{Colors.ENDC}")
-    print(f"  {Colors.OKCYAN}git@github.com:username/repo-name.git{Colors.ENDC}")
-    print()
+    print("\n".join([
+        f"  {Colors.OKCYAN}https://github.com/username/repo-name{Colors.ENDC}",
+        f"  {Colors.OKCYAN}https://github.com/username/repo-name.git{Colors.ENDC}",
+        f"  {Colors.OKCYAN}git@github.com:username/repo-name.git{Colors.ENDC}",
+        "",
+    ]))
     
     while True:
         url = input(f"{Colors.OKCYAN}GitHub repository URL: {Colors.ENDC}").strip()
@@ -130,10 +204,12 @@ def get_github_repo_url() -> Tuple[str, str]:
         if not username or not repo_name:
             print_error("Invalid GitHub repository URL format.")
             print_info("Accepted formats:")
-            print("  - https://github.com/username/repo-name")
-            print("  - https://github.com/username/repo-name.git")
-            print("  - git@github.com:username/repo-name.git")
-            print("  - github.com/username/repo-name")
+            print("\n".join([
+                "  - https://github.com/username/repo-name",
+                "  - https://github.com/username/repo-name.git",
+                "  - git@github.com:username/repo-name.git",
+                "  - github.com/username/repo-name",
+            ]))
             retry = input("Try again? (y/n): ").strip().lower()
             if retry != 'y':
                 sys.exit(1)
@@ -142,60 +218,83 @@ def get_github_repo_url() -> Tuple[str, str]:
         return username, repo_name
 
 
+def _git_config_value(key: str, project_root: Path, scope_args: Tuple[str, ...] = ()) -> Optional[str]:
+    """Look up a single git config key.
+    Returns: the value, or None if it is not set
+    """
+    result = subprocess.run(
+        ['git', 'config', *scope_args, key],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
 def check_git_config(project_root: Optional[Path] = None) -> Tuple[bool, Optional[str], Optional[str]]:
     """Check if git user.name and user.email are configured.
     Returns: (is_configured, user_name, user_email)
     """
     try:
         if project_root is None:
-            project_root = Path(__file__).parent
+            project_root = _SCRIPT_DIR
         
-        # Check global config first
-        name_result = subprocess.run(
-            ['git', 'config', '--global', 'user.name'],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        email_result = subprocess.run(
-            ['git', 'config', '--global', 'user.email'],
+        # Local config only counts when the project is its own repository,
+        # not when it merely sits inside another one
+        has_repo = (project_root / '.git').exists()
+        
+        # Read every scope in a single git invocation; each line is
+        # "<scope>\t<key>=<value>", ordered from lowest to highest precedence
+        result = subprocess.run(
+            ['git', 'config', '--list', '--show-scope'],
             cwd=project_root,
             capture_output=True,
             text=True,
             check=False
         )
         
-        user_name = name_result.stdout.strip() if name_result.returncode == 0 else None
-        user_email = email_result.stdout.strip() if email_result.returncode == 0 else None
+        if result.returncode != 0:
+            # --show-scope needs git 2.26+; query the keys one at a time instead
+            user_name = _git_config_value('user.name', project_root, ('--global',))
+            user_email = _git_config_value('user.email', project_root, ('--global',))
+            
+            if user_name and user_email:
+                return True, user_name, user_email
+            
+            if has_repo:
+                user_name = _git_config_value('user.name', project_root)
+                user_email = _git_config_value('user.email', project_root)
+                
+                if user_name and user_email:
+                    return True, user_name, user_email
+            
+            return False, user_name, user_email
+        
+        scoped = {}
+        effective = {}
+        for line in result.stdout.splitlines():
+            scope, _, entry = line.partition('\t')
+            key, sep, value = entry.partition('=')
+            if sep and key in ('user.name', 'user.email'):
+                scoped[(scope, key)] = value
+                effective[key] = value
+        
+        # Check global config first
+        user_name = scoped.get(('global', 'user.name'))
+        user_email = scoped.get(('global', 'user.email'))
         
         if user_name and user_email:
             return True, user_name, user_email
         
-        # Check local config if global not set
-        if (project_root / '.git').exists():
-            name_result = subprocess.run(
-                ['git', 'config', 'user.name'],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            email_result = subprocess.run(
-                ['git', 'config', 'user.email'],
-                cwd=project_root,
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            user_name = name_result.stdout.strip() if name_result.returncode == 0 else None
-            user_email = email_result.stdout.strip() if email_result.returncode == 0 else None
-            
-            if user_name and user_email:
-                return True, user_name, user_email
+        if not has_repo:
+            return False, user_name, user_email
+        
+        # Fall back to the effective values (local config overrides global)
+        user_name = effective.get('user.name')
+        user_email = effective.get('user.email')
         
-        return False, user_name, user_email
+        return bool(user_name and user_email), user_name, user_email
     except FileNotFoundError:
         return False, None, None
 
@@ -245,22 +344,14 @@ def configure_git_user(project_root: Path, set_global: bool = False) -> bool:
         return False
 
 
+@functools.lru_cache(maxsize=1)
 def check_ssh_keys() -> bool:
     """Check if SSH keys exist (doesn't verify GitHub connection)."""
     try:
-        # Check for SSH keys in common locations
-        ssh_dir = Path.home() / '.ssh'
-        if not ssh_dir.exists():
-            return False
-        
-        # Check for common SSH key files
-        ssh_key_files = ['id_rsa', 'id_ed25519', 'id_ecdsa', 'id_dsa']
-        for key_file in ssh_key_files:
-            # Check for private key or public key
-            if (ssh_dir / key_file).exists() or (ssh_dir / f"{key_file}.pub").exists():
-                return True
-        
-        return False
+        # List ~/.ssh once and look for common private or public key files
+        with os.scandir(Path.home() / '.ssh') as it:
+            names = {entry.name for entry in it}
+        return not names.isdisjoint(_SSH_KEY_FILES)
     except Exception:
         return False
 
@@ -293,6 +384,21 @@ def get_remote_preference() -> str:
             print_error("Invalid choice. Please enter 1 or 2.")
 
 
+@functools.lru_cache(maxsize=4)
+def _build_urls(username: str, repo_name: str) -> Tuple[str, str, str, str]:
+    """Build the GitHub URLs shown during setup for a repository.
+    Returns: (pages_settings, ghpages_tree, ghpages_images, repo_url), where
+    the first three are already wrapped in color codes.
+    """
+    repo_url = f"https://github.com/{username}/{repo_name}"
+    return (
+        f"{Colors.OKCYAN}{repo_url}/settings/pages{Colors.ENDC}",
+        f"{Colors.OKCYAN}{repo_url}/tree/gh-pages{Colors.ENDC}",
+        f"{Colors.OKCYAN}{repo_url}/tree/gh-pages/images{Colors.ENDC}",
+        repo_url,
+    )
+
+
 def get_remote_url(username: str, repo_name: str, remote_type: str = "ssh") -> str:
     """Generate remote URL based on type."""
     if remote_type == "ssh":
@@ -355,6 +461,36 @@ def get_destination_path(repo_name: str, default_path: Path) -> Path:
             continue
 
 
+def _copytree_nogit(src: str, dst: str) -> None:
+    """Recursively copy src to dst (which must not exist), skipping .git entries.
+    Directories are created on the calling thread while walking; file copies
+    are fanned out to a thread pool.
+    """
+    directories = []
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as executor:
+        pending = []
+        stack = [(src, dst)]
+        while stack:
+            src_dir, dst_dir = stack.pop()
+            os.makedirs(dst_dir)
+            directories.append((src_dir, dst_dir))
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    if entry.name == '.git':
+                        continue
+                    target = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        stack.append((entry.path, target))
+                    else:
+                        pending.append(executor.submit(shutil.copy2, entry.path, target))
+        for future in pending:
+            future.result()
+    
+    # Copy directory metadata last so creating their contents doesn't undo it
+    for src_dir, dst_dir in reversed(directories):
+        shutil.copystat(src_dir, dst_dir)
+
+
 def copy_template_folder(repo_name: str, destination_path: Path) -> Optional[Path]:
     """Copy the template folder to a new location with the repository name.
     Excludes .git directory from the copy.
@@ -365,7 +501,7 @@ def copy_template_folder(repo_name: str, destination_path: Path) -> Optional[Pat
     
     Returns the new project root path if successful, None otherwise.
     """
-    template_project_root = Path(__file__).parent
+    template_project_root = _SCRIPT_DIR
     new_folder_path = destination_path
     
     # Check if target folder already exists
@@ -389,19 +525,8 @@ def copy_template_folder(repo_name: str, destination_path: Path) -> Optional[Pat
         print_info(f"Destination: {new_folder_path}")
         
         # Copy the entire folder, excluding .git
-        def ignore_git(dirname, filenames):
-            """Ignore .git directory and its contents."""
-            ignored = []
-            if '.git' in filenames:
-                ignored.append('.git')
-            return ignored
-        
-        shutil.copytree(
-            template_project_root,
-            new_folder_path,
-            ignore=ignore_git,
-            dirs_exist_ok=False
-        )
+        sys.stdout.flush()
+        _copytree_nogit(str(template_project_root), str(new_folder_path))
         
         print_success(f"Template folder copied successfully!")
         print_info(f"New project path: {new_folder_path}")
@@ -423,7 +548,7 @@ def copy_template_folder(repo_name: str, destination_path: Path) -> Optional[Pat
 def update_config_toml(username: str, repo_name: str, project_root: Optional[Path] = None) -> bool:
     """Update config.toml with the provided GitHub Pages URL."""
     if project_root is None:
-        project_root = Path(__file__).parent
+        project_root = _SCRIPT_DIR
     config_path = project_root / 'config.toml'
     
     if not config_path.exists():
@@ -432,24 +557,27 @@ def update_config_toml(username: str, repo_name: str, project_root: Optional[Pat
     
     base_url = f"https://{username}.github.io/{repo_name}"
     
+    base_url_line = f'base_url = "{base_url}"'.encode('utf-8')
+    
+    def replace_setting(match):
+        if match.group(1) == b'base_url':
+            return base_url_line
+        # Set domain to empty for project sites
+        return b'domain = ""'
+    
     try:
-        # Read current config
-        with open(config_path, 'r', encoding='utf-8') as f:
+        # Read current config as raw bytes (no decode/encode round trip)
+        with open(config_path, 'rb') as f:
             content = f.read()
         
-        # Update base_url
-        pattern = r'base_url\s*=\s*"[^"]*"'
-        replacement = f'base_url = "{base_url}"'
-        content = re.sub(pattern, replacement, content)
-        
-        # Update domain (set to empty for project sites)
-        pattern = r'domain\s*=\s*"[^"]*"'
-        replacement = 'domain = ""'
-        content = re.sub(pattern, replacement, content)
+        # Update base_url and domain in a single pass
+        updated = _CONFIG_SETTING_RE.sub(replace_setting, content)
         
-        # Write updated config
-        with open(config_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Write updated config, leaving the file (and its mtime) untouched
+        # when nothing changed
+        if updated != content:
+            with open(config_path, 'wb') as f:
+                f.write(updated)
         
         print_success(f"Updated config.toml with base_url: {base_url}")
         return True
@@ -493,6 +621,9 @@ def generate_git_commands(username: str, repo_name: str, project_root: Path, rem
                 commands.append(f"git remote add origin {remote_url}")
         except:
             commands.append(f"git remote add origin {remote_url}")
+        # Existing repos might be on 'master'; renaming is a no-op if the
+        # branch is already 'main', so there's no need to probe for it
+        commands.append("git branch -M main")
     else:
         # Initialize new git repository (copy doesn't have .git)
         commands.append("git init -b main")  # Initialize with 'main' branch
@@ -500,38 +631,69 @@ def generate_git_commands(username: str, repo_name: str, project_root: Path, rem
         commands.append('git commit -m "Initial commit from static-assets-template"')
         commands.append(f"git remote add origin {remote_url}")
     
-    # Only rename branch if needed (git init -b main already creates main branch)
-    # For existing repos that might have 'master' branch, we'll rename it
-    if (project_root / '.git').exists():
-        # Check current branch name
+    commands.append(f"git push -u origin main")
+    
+    return commands
+
+
+def git_argv(cmd: str, project_root: Path) -> List[str]:
+    """Turn a displayed git command into argv form targeting project_root.
+    Running git directly with -C avoids spawning a shell for each command.
+    """
+    argv = shlex.split(cmd)
+    return [argv[0], '-C', str(project_root)] + argv[1:]
+
+
+def run_git_commands(commands: List[str], project_root: Path) -> bool:
+    """Run git commands in order, stopping at the first failure.
+    Returns True if every command succeeded.
+    """
+    for i, cmd in enumerate(commands):
+        print_info(f"Running: {cmd}")
+        # git may block on the network or prompt for credentials on the tty
+        sys.stdout.flush()
         try:
             result = subprocess.run(
-                ['git', 'branch', '--show-current'],
-                cwd=project_root,
+                git_argv(cmd, project_root),
+                check=False,
                 capture_output=True,
-                text=True,
-                check=False
+                text=True
             )
-            current_branch = result.stdout.strip() if result.returncode == 0 else None
-            if current_branch and current_branch != 'main':
-                commands.append("git branch -M main")
-        except:
-            pass
-    
-    commands.append(f"git push -u origin main")
+        except Exception as e:
+            print_error(f"Error running command: {e}")
+            print_warning("Please run the commands manually.")
+            return False
+        
+        if result.returncode != 0:
+            print_warning(f"Command returned non-zero exit code.")
+            if result.stderr:
+                # Print error output
+                for line in result.stderr.strip().split('\n'):
+                    if line.strip():
+                        print(f"   {Colors.FAIL}{line}{Colors.ENDC}")
+            if i < len(commands) - 1:
+                print_warning("Remaining commands will be skipped.")
+            return False
+        
+        print_success(f"Command completed successfully")
     
-    return commands
+    return True
 
 
 def main():
     """Main setup function."""
+    C, G, Y, B, E = Colors.OKCYAN, Colors.OKGREEN, Colors.WARNING, Colors.BOLD, Colors.ENDC
+    use_buffered_stdout()
+    
     print_header("Static Assets Template Setup")
     
     print_info("This script will help you configure the template for your GitHub repository.")
     print_info("You'll need:")
-    print("  1. A GitHub account")
-    print("  2. A new repository created on GitHub (or we'll help you create one)")
-    print("  3. Your GitHub repository URL\n")
+    print("\n".join([
+        "  1. A GitHub account",
+        "  2. A new repository created on GitHub (or we'll help you create one)",
+        "  3. Your GitHub repository URL\n",
+    ]))
     
     # Get GitHub repository URL and parse it
     username, repo_name = get_github_repo_url()
@@ -540,18 +702,17 @@ def main():
     
     # Copy template folder to new location
     print_header("Creating Project Copy")
-    template_project_root = Path(__file__).parent
-    parent_dir = template_project_root.parent
-    default_folder_path = parent_dir / repo_name
+    template_project_root = _SCRIPT_DIR
+    default_folder_path = _SCRIPT_PARENT / repo_name
     
-    print_info(f"Template folder: {Colors.OKCYAN}{template_project_root}{Colors.ENDC}")
+    print_info(f"Template folder: {C}{template_project_root}{E}")
     print()
     
     # Get destination path (default or custom)
     destination_path = get_destination_path(repo_name, default_folder_path)
     
     print()
-    print_info(f"Destination: {Colors.OKCYAN}{destination_path}{Colors.ENDC}")
+    print_info(f"Destination: {C}{destination_path}{E}")
     print_info("The template folder will be copied to the destination.")
     print_info("The original template folder will remain unchanged.")
     print()
@@ -563,55 +724,84 @@ def main():
     
     # Update references to work in the new folder
     current_project_root = new_project_root
-    
-    # Confirm settings
     base_url = f"https://{username}.github.io/{repo_name}"
-    repo_url = f"https://github.com/{username}/{repo_name}"
-    print(f"\n{Colors.BOLD}Configuration Summary:{Colors.ENDC}")
-    print(f"  GitHub Username: {Colors.OKGREEN}{username}{Colors.ENDC}")
-    print(f"  Repository Name: {Colors.OKGREEN}{repo_name}{Colors.ENDC}")
-    print(f"  Repository URL: {Colors.OKGREEN}{repo_url}{Colors.ENDC}\n")
-    
-    confirm = input(f"{Colors.WARNING}Is this correct? (y/n): {Colors.ENDC}").strip().lower()
-    if confirm != 'y':
-        print_info("Setup cancelled. Run the script again when ready.")
-        sys.exit(0)
-    
-    # Update config.toml
-    print_header("Updating Configuration")
-    if not update_config_toml(username, repo_name, current_project_root):
-        print_error("Failed to update configuration. Please check the error above.")
-        sys.exit(1)
     
-    # Generate URL links
-    print_header("Generating Asset Links")
+    # Start link generation now so it overlaps the confirmation prompt.
+    # The base URL is passed explicitly because config.toml is only
+    # updated once the user confirms.
     generate_url_script = current_project_root / 'scripts' / 'generate_url.py'
-    
-    if not generate_url_script.exists():
-        print_warning("generate_url.py script not found. Skipping link generation.")
-    else:
+    link_process = None
+    link_error = None
+    if generate_url_script.exists():
         try:
-            print_info("Generating markdown files with asset URLs...")
-            result = subprocess.run(
-                [sys.executable, str(generate_url_script)],
+            link_process = subprocess.Popen(
+                [sys.executable, str(generate_url_script), '--base-url', base_url],
                 cwd=current_project_root,
-                check=False,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True
             )
-            
-            if result.returncode == 0:
-                print_success("Asset links generated successfully!")
-                print_info("Updated files in links/ directory with new URLs")
-            else:
-                print_warning("Link generation completed with warnings.")
-                if result.stderr:
-                    for line in result.stderr.strip().split('\n'):
-                        if line.strip():
-                            print(f"   {Colors.WARNING}{line}{Colors.ENDC}")
         except Exception as e:
-            print_warning(f"Could not run generate_url.py: {e}")
-            print_info("You can run it manually later: python scripts/generate_url.py")
+            link_error = e
+    
+    # From here on, make sure the link generator never outlives setup,
+    # whether the user cancels, presses Ctrl-C or an error exits early
+    try:
+        # Probe git identity and SSH keys in the background; both are only
+        # needed later in the setup
+        probe_executor = ThreadPoolExecutor(max_workers=2)
+        git_config_future = probe_executor.submit(check_git_config, current_project_root)
+        probe_executor.submit(check_ssh_keys)
+        probe_executor.shutdown(wait=False)
+        
+        # Confirm settings
+        pages_url, ghpages_tree, ghpages_images, repo_url = _build_urls(username, repo_name)
+        print(f"\n{B}Configuration Summary:{E}")
+        print(f"  GitHub Username: {G}{username}{E}")
+        print(f"  Repository Name: {G}{repo_name}{E}")
+        print(f"  Repository URL: {G}{repo_url}{E}\n")
+        
+        confirm = input(f"{Y}Is this correct? (y/n): {E}").strip().lower()
+        if confirm != 'y':
+            print_info("Setup cancelled. Run the script again when ready.")
+            sys.exit(0)
+        
+        # Update config.toml
+        print_header("Updating Configuration")
+        if not update_config_toml(username, repo_name, current_project_root):
+            print_error("Failed to update configuration. Please check the error above.")
+            sys.exit(1)
+        
+        # Generate URL links
+        print_header("Generating Asset Links")
+        
+        if not generate_url_script.exists():
+            print_warning("generate_url.py script not found. Skipping link generation.")
+        else:
+            try:
+                print_info("Generating markdown files with asset URLs...")
+                if link_error is not None:
+                    raise link_error
+                # Show the progress above before waiting on the generator
+                sys.stdout.flush()
+                _, stderr = link_process.communicate()
+                
+                if link_process.returncode == 0:
+                    print_success("Asset links generated successfully!")
+                    print_info("Updated files in links/ directory with new URLs")
+                else:
+                    print_warning("Link generation completed with warnings.")
+                    if stderr:
+                        for line in stderr.strip().split('\n'):
+                            if line.strip():
+                                print(f"   {Y}{line}{E}")
+            except Exception as e:
+                print_warning(f"Could not run generate_url.py: {e}")
+                print_info("You can run it manually later: python scripts/generate_url.py")
+    finally:
+        if link_process is not None and link_process.returncode is None:
+            link_process.kill()
+            link_process.wait()
     
     # Ask for remote preference (SSH or HTTPS)
     print_header("Git Remote Configuration")
@@ -636,33 +826,34 @@ def main():
     # Generate next steps
     print_header("Next Steps")
     
-    print(f"{Colors.BOLD}1. Create GitHub Repository:{Colors.ENDC}")
-    print(f"   Go to: {Colors.OKCYAN}https://github.com/new{Colors.ENDC}")
-    print(f"   Repository name: {Colors.OKGREEN}{repo_name}{Colors.ENDC}")
-    print(f"   DO NOT initialize with README, .gitignore, or license")
-    print(f"   Click 'Create repository'\n")
-    
-    print(f"{Colors.BOLD}2. Initialize Git and Push:{Colors.ENDC}")
-    print(f"   {Colors.OKCYAN}Note: The script can run these commands for you automatically.{Colors.ENDC}")
     git_commands = generate_git_commands(username, repo_name, current_project_root, remote_type)
-    for i, cmd in enumerate(git_commands, 1):
-        print(f"   {Colors.OKCYAN}{cmd}{Colors.ENDC}")
-    print()
+    command_lines = "".join(f"   {C}{cmd}{E}\n" for cmd in git_commands)
+    sys.stdout.write(
+        f"{B}1. Create GitHub Repository:{E}\n"
+        f"   Go to: {C}https://github.com/new{E}\n"
+        f"   Repository name: {G}{repo_name}{E}\n"
+        f"   DO NOT initialize with README, .gitignore, or license\n"
+        f"   Click 'Create repository'\n\n"
+        f"{B}2. Initialize Git and Push:{E}\n"
+        f"   {C}Note: The script can run these commands for you automatically.{E}\n"
+        f"{command_lines}\n"
+    )
     
     # Ask if user wants to run git commands
     push_succeeded = False  # Track if push succeeded (for showing URLs later)
     
     if git_commands:
-        run_git = input(f"{Colors.OKCYAN}Would you like to run the git commands now? (y/n): {Colors.ENDC}").strip().lower()
+        run_git = input(f"{C}Would you like to run the git commands now? (y/n): {E}").strip().lower()
         if run_git == 'y':
             print_header("Running Git Commands")
             project_root = current_project_root
             
             # Check git user configuration before running commands
-            is_git_configured, git_name, git_email = check_git_config(project_root)
+            sys.stdout.flush()
+            is_git_configured, git_name, git_email = git_config_future.result()
             if not is_git_configured:
                 print()
-                set_global = input(f"{Colors.OKCYAN}Set git user globally (for all repos) or locally (this repo only)? (global/local) [local]: {Colors.ENDC}").strip().lower()
+                set_global = input(f"{C}Set git user globally (for all repos) or locally (this repo only)? (global/local) [local]: {E}").strip().lower()
                 set_global = set_global == 'global'
                 
                 if not configure_git_user(project_root, set_global=set_global):
@@ -672,111 +863,67 @@ def main():
                     print_warning("Continuing with git commands, but commit may fail if user is not configured.")
                 print()
             
-            # Track if commit and push succeeded
-            commit_succeeded = False
-            should_skip_remaining = False
-            
-            for i, cmd in enumerate(git_commands):
-                # Skip remaining commands if commit failed
-                if should_skip_remaining:
-                    if 'push' in cmd.lower():
-                        print_warning(f"Skipping: {cmd}")
-                        print_info("(Commit did not succeed, so push is skipped)")
-                    continue
-                
-                print_info(f"Running: {cmd}")
-                try:
-                    result = subprocess.run(
-                        cmd,
-                        shell=True,
-                        cwd=project_root,
-                        check=False,
-                        capture_output=True,
-                        text=True
-                    )
-                    
-                    if result.returncode == 0:
-                        print_success(f"Command completed successfully")
-                        # Check if this was a commit command
-                        if 'commit' in cmd.lower():
-                            commit_succeeded = True
-                        # Check if this was a push command
-                        if 'push' in cmd.lower():
-                            push_succeeded = True
-                    else:
-                        print_warning(f"Command returned non-zero exit code.")
-                        if result.stderr:
-                            # Print error output
-                            for line in result.stderr.strip().split('\n'):
-                                if line.strip():
-                                    print(f"   {Colors.FAIL}{line}{Colors.ENDC}")
-                        
-                        # If commit failed, skip remaining commands (especially push)
-                        if 'commit' in cmd.lower():
-                            commit_succeeded = False
-                            should_skip_remaining = True
-                            print_warning("Commit failed. Remaining commands will be skipped.")
-                        elif 'push' in cmd.lower() and not commit_succeeded:
-                            print_warning("Push skipped - commit did not succeed.")
-                except Exception as e:
-                    print_error(f"Error running command: {e}")
-                    print_warning("Please run the commands manually.")
-                    if 'commit' in cmd.lower():
-                        should_skip_remaining = True
-                    break
+            # Run everything before the push as one batch that stops at the
+            # first failure; the push runs on its own so its result is
+            # reported separately
+            *setup_commands, push_command = git_commands
+            if run_git_commands(setup_commands, project_root):
+                push_succeeded = run_git_commands([push_command], project_root)
+            else:
+                print_warning(f"Skipping: {push_command}")
+                print_info("(Earlier commands did not succeed, so push is skipped)")
     
     print_header("Setup Complete!")
     print_success("Configuration has been updated successfully!")
     
     # Show GitHub Pages URL and test URLs if git push succeeded
     if push_succeeded:
-        print()
-        print(f"{Colors.BOLD}GitHub Pages URL:{Colors.ENDC}")
-        print(f"   {Colors.OKGREEN}{base_url}{Colors.ENDC}\n")
-        
-        print(f"{Colors.BOLD}Test Your URLs:{Colors.ENDC}")
-        print(f"   Sample image (JPG): {Colors.OKCYAN}{base_url}/images/sample.jpg{Colors.ENDC}")
-        print(f"   Sample image (WebP): {Colors.OKCYAN}{base_url}/images/sample.webp{Colors.ENDC}")
-        print(f"   Minified CSS: {Colors.OKCYAN}{base_url}/css/style.min.css{Colors.ENDC}")
-        print(f"   Minified JS: {Colors.OKCYAN}{base_url}/js/app.min.js{Colors.ENDC}\n")
+        sys.stdout.write(
+            f"\n"
+            f"{B}GitHub Pages URL:{E}\n"
+            f"   {G}{base_url}{E}\n\n"
+            f"{B}Test Your URLs:{E}\n"
+            f"   Sample image (JPG): {C}{base_url}/images/sample.jpg{E}\n"
+            f"   Sample image (WebP): {C}{base_url}/images/sample.webp{E}\n"
+            f"   Minified CSS: {C}{base_url}/css/style.min.css{E}\n"
+            f"   Minified JS: {C}{base_url}/js/app.min.js{E}\n\n"
+        )
     
     # Show deployment wait step (only if push succeeded)
     if push_succeeded:
-        print(f"{Colors.BOLD}Next: Wait for Deployment{Colors.ENDC}")
-        print(f"   1. Go to: {Colors.OKCYAN}https://github.com/{username}/{repo_name}/actions{Colors.ENDC}")
-        print(f"   2. Wait for 'Deploy to GitHub Pages' workflow to complete")
-        print(f"      (This will create the 'gh-pages' branch)\n")
-        
-        print(f"{Colors.BOLD}3. {Colors.WARNING}⚠️  IMPORTANT - Configure GitHub Pages:{Colors.ENDC}")
-        print(f"   {Colors.WARNING}This is a REQUIRED step for your site to work!{Colors.ENDC}")
-        print(f"   {Colors.WARNING}Do this AFTER the workflow creates the 'gh-pages' branch.{Colors.ENDC}")
-        print(f"   Go to: {Colors.OKCYAN}https://github.com/{username}/{repo_name}/settings/pages{Colors.ENDC}")
-        print(f"   Under 'Source', select: {Colors.OKGREEN}Deploy from a branch{Colors.ENDC}")
-        print(f"   Branch: {Colors.OKGREEN}gh-pages{Colors.ENDC}")
-        print(f"   Folder: {Colors.OKGREEN}/(root){Colors.ENDC}")
-        print(f"   {Colors.WARNING}Make sure to select 'gh-pages' branch (not 'main'){Colors.ENDC}\n")
-        
-        print(f"   4. Wait 2-5 minutes for GitHub Pages to propagate")
-        print(f"   5. Your site will be available at: {Colors.OKGREEN}{base_url}{Colors.ENDC}\n")
-    
-    print(f"{Colors.BOLD}Troubleshooting:{Colors.ENDC}")
-    print(f"   If you get 404 errors, check:")
-    print(f"   - Verify workflow completed successfully")
-    print(f"   - Check that 'gh-pages' branch exists: {Colors.OKCYAN}https://github.com/{username}/{repo_name}/tree/gh-pages{Colors.ENDC}")
-    print(f"   - Verify GitHub Pages is set to 'gh-pages' branch (not 'main')")
-    print(f"   - Wait a few minutes - GitHub Pages can take 2-5 minutes to update")
-    print(f"   - Check if files exist in gh-pages branch: {Colors.OKCYAN}https://github.com/{username}/{repo_name}/tree/gh-pages/images{Colors.ENDC}\n")
-    
-    print_info("Follow the steps above to complete your GitHub Pages setup.")
-    print_info(f"For detailed instructions, see: {Colors.OKCYAN}SETUP.md{Colors.ENDC}\n")
+        sys.stdout.write(
+            f"{B}Next: Wait for Deployment{E}\n"
+            f"   1. Go to: {C}{repo_url}/actions{E}\n"
+            f"   2. Wait for 'Deploy to GitHub Pages' workflow to complete\n"
+            f"      (This will create the 'gh-pages' branch)\n\n"
+            f"{B}3. {Y}⚠️  IMPORTANT - Configure GitHub Pages:{E}\n"
+            f"   {Y}This is a REQUIRED step for your site to work!{E}\n"
+            f"   {Y}Do this AFTER the workflow creates the 'gh-pages' branch.{E}\n"
+            f"   Go to: {pages_url}\n"
+            f"   Under 'Source', select: {G}Deploy from a branch{E}\n"
+            f"   Branch: {G}gh-pages{E}\n"
+            f"   Folder: {G}/(root){E}\n"
+            f"   {Y}Make sure to select 'gh-pages' branch (not 'main'){E}\n\n"
+            f"   4. Wait 2-5 minutes for GitHub Pages to propagate\n"
+            f"   5. Your site will be available at: {G}{base_url}{E}\n\n"
+        )
+    
+    sys.stdout.write(_TROUBLESHOOT_TMPL.format(ghpages_tree=ghpages_tree, ghpages_images=ghpages_images))
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print(f"\n\n{Colors.WARNING}Setup cancelled by user.{Colors.ENDC}")
+        # Write the final messages with a single unbuffered syscall so they
+        # can't be lost in a buffer; flush pending output first to keep order
+        sys.stdout.flush()
+        os.write(1, _CANCELLED_MSG)
         sys.exit(1)
     except Exception as e:
-        print_error(f"An unexpected error occurred: {e}")
+        sys.stdout.flush()
+        os.write(2, f"{_ERR_PREFIX}{e}{Colors.ENDC}\n".encode('utf-8', 'replace'))
         sys.exit(1)
+    finally:
+        sys.stdout.flush()